@@ -66,6 +66,7 @@ class AiopgInstrumentor(BaseInstrumentor):
         """
 
         tracer_provider = kwargs.get("tracer_provider")
+        propagate_context = kwargs.get("propagate_context", False)
 
         wrappers.wrap_connect(
             __name__,
@@ -73,6 +74,7 @@ class AiopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
 
         wrappers.wrap_create_pool(
@@ -81,6 +83,7 @@ class AiopgInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
 
     def _uninstrument(self, **kwargs):
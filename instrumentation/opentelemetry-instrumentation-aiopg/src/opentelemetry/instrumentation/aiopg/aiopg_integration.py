@@ -1,17 +1,29 @@
+import types
 import typing
 
-import wrapt
-from aiopg.utils import _ContextManager, _PoolAcquireContextManager
-
 from opentelemetry.instrumentation.dbapi import (
     CursorTracer,
     DatabaseApiIntegration,
+    ProxyObject,
 )
-from opentelemetry.trace import SpanKind
+
+# aiopg is only needed once connections are traced, importing it on first
+# use keeps loading the instrumentation cheap.
+_aiopg_utils = None
+
+
+def _get_aiopg_utils():
+    global _aiopg_utils  # pylint: disable=global-statement
+    if _aiopg_utils is None:
+        import aiopg.utils  # pylint: disable=import-outside-toplevel
+
+        _aiopg_utils = aiopg.utils
+    return _aiopg_utils
 
 
-# pylint: disable=abstract-method
-class AsyncProxyObject(wrapt.ObjectProxy):
+class AsyncProxyObject(ProxyObject):
+    __slots__ = ()
+
     def __aiter__(self):
         return self.__wrapped__.__aiter__()
 
@@ -29,7 +41,38 @@ class AsyncProxyObject(wrapt.ObjectProxy):
         return self.__wrapped__.__await__()
 
 
+class AsyncCursorTracer(CursorTracer):
+    async def traced_execution(
+        self,
+        cursor,
+        query_method: typing.Callable[..., typing.Any],
+        *args: typing.Tuple[typing.Any, typing.Any],
+        **kwargs: typing.Dict[typing.Any, typing.Any]
+    ):
+        if self._db_api_integration.is_noop():
+            return await query_method(*args, **kwargs)
+        tracer = self._db_api_integration.get_tracer()
+
+        name = ""
+        if args:
+            name = self.get_operation_name(cursor, args)
+
+        if not name:
+            name = (
+                self._db_api_integration.database
+                if self._db_api_integration.database
+                else self._db_api_integration.name
+            )
+
+        with self._start_span(tracer, name) as span:
+            if span.is_recording():
+                self._populate_span(span, cursor, *args)
+            return await query_method(*args, **kwargs)
+
+
 class AiopgIntegration(DatabaseApiIntegration):
+    cursor_tracer_cls = AsyncCursorTracer
+
     async def wrapped_connection(
         self,
         connect_method: typing.Callable[..., typing.Any],
@@ -44,109 +87,150 @@ class AiopgIntegration(DatabaseApiIntegration):
 
     async def wrapped_pool(self, create_pool_method, args, kwargs):
         pool = await create_pool_method(*args, **kwargs)
-        async with pool.acquire() as connection:
-            # pylint: disable=protected-access
-            self.get_connection_attributes(connection._conn)
+        connection = _get_pool_connection(args, kwargs)
+        if connection is not None:
+            self.get_connection_attributes(connection)
+        else:
+            async with pool.acquire() as connection:
+                # pylint: disable=protected-access
+                self.get_connection_attributes(connection._conn)
         return get_traced_pool_proxy(pool, self)
 
 
+_DSN_KEYWORDS = ("dbname", "database", "user", "host", "port")
+_REQUIRED_DSN_KEYWORDS = ("dbname", "user", "host", "port")
+
+
+def _get_pool_connection(args, kwargs):
+    """Returns a stand-in for the psycopg2 connection of a pool.
+
+    The connection parameters are read from the DSN and keyword arguments
+    given to ``create_pool``, so that no connection has to be acquired from
+    the pool. The result exposes them through an ``info`` attribute, like
+    ``psycopg2.extensions.ConnectionInfo``. ``None`` is returned unless the
+    database name, user, host and port are all given, since libpq resolves
+    missing ones from the environment or its defaults, in which case they
+    can only be read from a connection.
+    """
+    # pylint: disable=import-outside-toplevel
+    import psycopg2
+    from psycopg2.extensions import make_dsn, parse_dsn
+
+    dsn = args[0] if args else kwargs.get("dsn")
+    dsn_kwargs = {
+        key: kwargs[key]
+        for key in _DSN_KEYWORDS
+        if kwargs.get(key) is not None
+    }
+    if not dsn and not dsn_kwargs:
+        return None
+    try:
+        info = parse_dsn(make_dsn(dsn, **dsn_kwargs))
+    except psycopg2.Error:
+        return None
+    if not all(info.get(key) for key in _REQUIRED_DSN_KEYWORDS):
+        return None
+    if not info["port"].isdigit():
+        return None
+    info["port"] = int(info["port"])
+    return types.SimpleNamespace(info=types.SimpleNamespace(**info))
+
+
+class TracedConnectionProxy(AsyncProxyObject):
+    __slots__ = ("_db_api_integration",)
+
+    # Looked up on the proxy type, so checking it never reaches the
+    # wrapped connection.
+    _otel_traced = True
+
+    def __init__(self, connection, db_api_integration):
+        super().__init__(connection)
+        object.__setattr__(self, "_db_api_integration", db_api_integration)
+
+    def cursor(self, *args, **kwargs):
+        coro = self._cursor(*args, **kwargs)
+        # pylint: disable=protected-access
+        return _get_aiopg_utils()._ContextManager(coro)
+
+    async def _cursor(self, *args, **kwargs):
+        # pylint: disable=protected-access
+        cursor = await self.__wrapped__._cursor(*args, **kwargs)
+        return get_traced_cursor_proxy(cursor, self._db_api_integration)
+
+
+# pylint: disable=unused-argument
 def get_traced_connection_proxy(
     connection, db_api_integration, *args, **kwargs
 ):
-    # pylint: disable=abstract-method
-    class TracedConnectionProxy(AsyncProxyObject):
-        # pylint: disable=unused-argument
-        def __init__(self, connection, *args, **kwargs):
-            super().__init__(connection)
+    return TracedConnectionProxy(connection, db_api_integration)
 
-        def cursor(self, *args, **kwargs):
-            coro = self._cursor(*args, **kwargs)
-            return _ContextManager(coro)
 
-        async def _cursor(self, *args, **kwargs):
-            # pylint: disable=protected-access
-            cursor = await self.__wrapped__._cursor(*args, **kwargs)
-            return get_traced_cursor_proxy(cursor, db_api_integration)
+class TracedPoolProxy(AsyncProxyObject):
+    __slots__ = ("_db_api_integration",)
 
-    return TracedConnectionProxy(connection, *args, **kwargs)
+    def __init__(self, pool, db_api_integration):
+        super().__init__(pool)
+        object.__setattr__(self, "_db_api_integration", db_api_integration)
 
+    def acquire(self):
+        """Acquire free connection from the pool."""
+        coro = self._acquire()
+        # pylint: disable=protected-access
+        return _get_aiopg_utils()._PoolAcquireContextManager(coro, self)
 
-def get_traced_pool_proxy(pool, db_api_integration, *args, **kwargs):
-    # pylint: disable=abstract-method
-    class TracedPoolProxy(AsyncProxyObject):
-        # pylint: disable=unused-argument
-        def __init__(self, pool, *args, **kwargs):
-            super().__init__(pool)
-
-        def acquire(self):
-            """Acquire free connection from the pool."""
-            coro = self._acquire()
-            return _PoolAcquireContextManager(coro, self)
-
-        async def _acquire(self):
-            # pylint: disable=protected-access
-            connection = await self.__wrapped__._acquire()
-            if not isinstance(connection, AsyncProxyObject):
-                connection = get_traced_connection_proxy(
-                    connection, db_api_integration, *args, **kwargs
-                )
+    async def _acquire(self):
+        # pylint: disable=protected-access
+        connection = await self.__wrapped__._acquire()
+        if getattr(connection, "_otel_traced", False):
             return connection
-
-    return TracedPoolProxy(pool, *args, **kwargs)
-
-
-class AsyncCursorTracer(CursorTracer):
-    async def traced_execution(
-        self,
-        cursor,
-        query_method: typing.Callable[..., typing.Any],
-        *args: typing.Tuple[typing.Any, typing.Any],
-        **kwargs: typing.Dict[typing.Any, typing.Any]
-    ):
-        name = ""
-        if args:
-            name = self.get_operation_name(cursor, args)
-
-        if not name:
-            name = (
-                self._db_api_integration.database
-                if self._db_api_integration.database
-                else self._db_api_integration.name
-            )
-
-        with self._db_api_integration.get_tracer().start_as_current_span(
-            name, kind=SpanKind.CLIENT
-        ) as span:
-            self._populate_span(span, cursor, *args)
-            return await query_method(*args, **kwargs)
+        if self._db_api_integration.is_noop():
+            return connection
+        return get_traced_connection_proxy(
+            connection, self._db_api_integration
+        )
 
 
+# pylint: disable=unused-argument
+def get_traced_pool_proxy(pool, db_api_integration, *args, **kwargs):
+    return TracedPoolProxy(pool, db_api_integration)
+
+
+class AsyncCursorTracerProxy(AsyncProxyObject):
+    __slots__ = ("_cursor_tracer", "_tracer_noop")
+
+    def __init__(self, cursor, cursor_tracer, tracer_noop=False):
+        super().__init__(cursor)
+        object.__setattr__(self, "_cursor_tracer", cursor_tracer)
+        object.__setattr__(self, "_tracer_noop", tracer_noop)
+
+    # These return the awaitable instead of awaiting it, and with a no-op
+    # tracer they hand out the wrapped cursor's coroutine untouched.
+    def execute(self, *args, **kwargs):
+        if self._tracer_noop:
+            return self.__wrapped__.execute(*args, **kwargs)
+        return self._cursor_tracer.traced_execution(
+            self, self.__wrapped__.execute, *args, **kwargs
+        )
+
+    def executemany(self, *args, **kwargs):
+        if self._tracer_noop:
+            return self.__wrapped__.executemany(*args, **kwargs)
+        return self._cursor_tracer.traced_execution(
+            self, self.__wrapped__.executemany, *args, **kwargs
+        )
+
+    def callproc(self, *args, **kwargs):
+        if self._tracer_noop:
+            return self.__wrapped__.callproc(*args, **kwargs)
+        return self._cursor_tracer.traced_execution(
+            self, self.__wrapped__.callproc, *args, **kwargs
+        )
+
+
+# pylint: disable=unused-argument
 def get_traced_cursor_proxy(cursor, db_api_integration, *args, **kwargs):
-    _traced_cursor = AsyncCursorTracer(db_api_integration)
-
-    # pylint: disable=abstract-method
-    class AsyncCursorTracerProxy(AsyncProxyObject):
-
-        # pylint: disable=unused-argument
-        def __init__(self, cursor, *args, **kwargs):
-            super().__init__(cursor)
-
-        async def execute(self, *args, **kwargs):
-            result = await _traced_cursor.traced_execution(
-                self, self.__wrapped__.execute, *args, **kwargs
-            )
-            return result
-
-        async def executemany(self, *args, **kwargs):
-            result = await _traced_cursor.traced_execution(
-                self, self.__wrapped__.executemany, *args, **kwargs
-            )
-            return result
-
-        async def callproc(self, *args, **kwargs):
-            result = await _traced_cursor.traced_execution(
-                self, self.__wrapped__.callproc, *args, **kwargs
-            )
-            return result
-
-    return AsyncCursorTracerProxy(cursor, *args, **kwargs)
+    return AsyncCursorTracerProxy(
+        cursor,
+        db_api_integration.get_cursor_tracer(),
+        tracer_noop=db_api_integration.is_noop(),
+    )
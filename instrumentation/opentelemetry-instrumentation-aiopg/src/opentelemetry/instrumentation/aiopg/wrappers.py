@@ -32,12 +32,11 @@ API
 import logging
 import typing
 
-import aiopg
 import wrapt
-from aiopg.utils import _ContextManager, _PoolContextManager
 
 from opentelemetry.instrumentation.aiopg.aiopg_integration import (
     AiopgIntegration,
+    TracedConnectionProxy,
     get_traced_connection_proxy,
 )
 from opentelemetry.instrumentation.aiopg.version import __version__
@@ -51,6 +50,7 @@ def trace_integration(
     database_system: str,
     connection_attributes: typing.Dict = None,
     tracer_provider: typing.Optional[TracerProvider] = None,
+    propagate_context: bool = False,
 ):
     """Integrate with aiopg library.
     based on dbapi integration, where replaced sync wrap methods to async
@@ -62,6 +62,8 @@ def trace_integration(
             user in Connection object.
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
+        propagate_context: Configure if query spans should be made the current
+            span while the query runs.
     """
 
     wrap_connect(
@@ -70,6 +72,7 @@ def trace_integration(
         connection_attributes,
         __version__,
         tracer_provider,
+        propagate_context=propagate_context,
     )
 
 
@@ -79,6 +82,7 @@ def wrap_connect(
     connection_attributes: typing.Dict = None,
     version: str = "",
     tracer_provider: typing.Optional[TracerProvider] = None,
+    propagate_context: bool = False,
 ):
     """Integrate with aiopg library.
     https://github.com/aio-libs/aiopg
@@ -92,7 +96,12 @@ def wrap_connect(
         version: Version of opentelemetry extension for aiopg.
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
+        propagate_context: Configure if query spans should be made the current
+            span while the query runs.
     """
+    # pylint: disable=import-outside-toplevel
+    import aiopg
+    from aiopg.utils import _ContextManager
 
     # pylint: disable=unused-argument
     def wrap_connect_(
@@ -107,6 +116,7 @@ def wrap_connect(
             connection_attributes=connection_attributes,
             version=version,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
         return _ContextManager(
             db_integration.wrapped_connection(wrapped, args, kwargs)
@@ -123,6 +133,8 @@ def unwrap_connect():
     https://github.com/aio-libs/aiopg
     """
 
+    import aiopg  # pylint: disable=import-outside-toplevel
+
     unwrap(aiopg, "connect")
 
 
@@ -133,6 +145,7 @@ def instrument_connection(
     connection_attributes: typing.Dict = None,
     version: str = "",
     tracer_provider: typing.Optional[TracerProvider] = None,
+    propagate_context: bool = False,
 ):
     """Enable instrumentation in a database connection.
 
@@ -146,6 +159,8 @@ def instrument_connection(
         version: Version of opentelemetry extension for aiopg.
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
+        propagate_context: Configure if query spans should be made the current
+            span while the query runs.
 
     Returns:
         An instrumented connection.
@@ -156,6 +171,7 @@ def instrument_connection(
         connection_attributes=connection_attributes,
         version=version,
         tracer_provider=tracer_provider,
+        propagate_context=propagate_context,
     )
     db_integration.get_connection_attributes(connection)
     return get_traced_connection_proxy(connection, db_integration)
@@ -170,7 +186,7 @@ def uninstrument_connection(connection):
     Returns:
         An uninstrumented connection.
     """
-    if isinstance(connection, wrapt.ObjectProxy):
+    if isinstance(connection, TracedConnectionProxy):
         return connection.__wrapped__
 
     logger.warning("Connection is not instrumented")
@@ -183,7 +199,12 @@ def wrap_create_pool(
     connection_attributes: typing.Dict = None,
     version: str = "",
     tracer_provider: typing.Optional[TracerProvider] = None,
+    propagate_context: bool = False,
 ):
+    # pylint: disable=import-outside-toplevel
+    import aiopg
+    from aiopg.utils import _PoolContextManager
+
     # pylint: disable=unused-argument
     def wrap_create_pool_(
         wrapped: typing.Callable[..., typing.Any],
@@ -197,6 +218,7 @@ def wrap_create_pool(
             connection_attributes=connection_attributes,
             version=version,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
         return _PoolContextManager(
             db_integration.wrapped_pool(wrapped, args, kwargs)
@@ -212,4 +234,6 @@ def unwrap_create_pool():
     """Disable integration with aiopg library.
     https://github.com/aio-libs/aiopg
     """
+    import aiopg  # pylint: disable=import-outside-toplevel
+
     unwrap(aiopg, "create_pool")
@@ -13,6 +13,7 @@
 # limitations under the License.
 import asyncio
 import logging
+import weakref
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -21,7 +22,11 @@ from aiopg.utils import _ContextManager, _PoolAcquireContextManager
 
 import opentelemetry.instrumentation.aiopg
 from opentelemetry import trace as trace_api
-from opentelemetry.instrumentation.aiopg import AiopgInstrumentor, wrappers
+from opentelemetry.instrumentation.aiopg import (
+    AiopgInstrumentor,
+    aiopg_integration,
+    wrappers,
+)
 from opentelemetry.instrumentation.aiopg.aiopg_integration import (
     AiopgIntegration,
 )
@@ -311,6 +316,36 @@ class TestAiopgIntegration(TestBase):
         self.assertFalse(mock_span.set_attribute.called)
         self.assertFalse(mock_span.set_status.called)
 
+    def test_noop_tracer_returns_wrapped_coroutine(self):
+        db_integration = AiopgIntegration(
+            self.tracer,
+            "testcomponent",
+            # pylint: disable=protected-access
+            tracer_provider=trace_api._DefaultTracerProvider(),
+        )
+        cursor = MockCursor()
+        coro = mock.Mock()
+        cursor.execute = mock.Mock(return_value=coro)
+        traced_cursor = aiopg_integration.get_traced_cursor_proxy(
+            cursor, db_integration
+        )
+        self.assertIs(traced_cursor.execute("Test query"), coro)
+        cursor.execute.assert_called_once_with("Test query")
+
+    def test_cursor_tracer_is_shared(self):
+        db_integration = AiopgIntegration(self.tracer, "testcomponent")
+        cursor1 = aiopg_integration.get_traced_cursor_proxy(
+            MockCursor(), db_integration
+        )
+        cursor2 = aiopg_integration.get_traced_cursor_proxy(
+            MockCursor(), db_integration
+        )
+        # pylint: disable=protected-access
+        self.assertIsInstance(
+            cursor1._cursor_tracer, aiopg_integration.AsyncCursorTracer
+        )
+        self.assertIs(cursor1._cursor_tracer, cursor2._cursor_tracer)
+
     def test_span_failed(self):
         db_integration = AiopgIntegration(self.tracer, "testcomponent")
         mock_connection = async_call(
@@ -393,6 +428,118 @@ class TestAiopgIntegration(TestBase):
             pool = async_call(aiopg.create_pool())
             async_call(check_connection(pool))
 
+    def test_wrapped_pool_reads_connection_attributes_from_dsn(self):
+        db_integration = AiopgIntegration(
+            self.tracer,
+            "testcomponent",
+            # pylint: disable=protected-access
+            AiopgInstrumentor._CONNECTION_ATTRIBUTES,
+        )
+        pool = AiopgPoolMock()
+        pool.acquire = mock.Mock()
+
+        # pylint: disable=unused-argument
+        async def create_pool(*args, **kwargs):
+            return pool
+
+        async_call(
+            db_integration.wrapped_pool(
+                create_pool,
+                ("host=testhost port=123 user=testuser",),
+                {"database": "testdatabase", "minsize": 1},
+            )
+        )
+        self.assertFalse(pool.acquire.called)
+        self.assertEqual(db_integration.database, "testdatabase")
+        self.assertEqual(
+            db_integration.span_attributes,
+            {
+                SpanAttributes.NET_PEER_NAME: "testhost",
+                SpanAttributes.NET_PEER_PORT: 123,
+                SpanAttributes.DB_USER: "testuser",
+            },
+        )
+
+    def test_wrapped_pool_acquires_connection_for_partial_dsn(self):
+        db_integration = AiopgIntegration(
+            self.tracer,
+            "testcomponent",
+            # pylint: disable=protected-access
+            AiopgInstrumentor._CONNECTION_ATTRIBUTES,
+        )
+        pool = AiopgPoolMock()
+        pool.acquire = mock.Mock(wraps=pool.acquire)
+
+        # pylint: disable=unused-argument
+        async def create_pool(*args, **kwargs):
+            return pool
+
+        for kwargs in (
+            {"database": "testdatabase"},
+            {"host": "testhost", "user": "testuser"},
+            {"host": "testhost", "user": "testuser", "port": 123},
+        ):
+            pool.acquire.reset_mock()
+            async_call(db_integration.wrapped_pool(create_pool, (), kwargs))
+            self.assertTrue(pool.acquire.called)
+
+    def test_pool_does_not_rewrap_traced_connection(self):
+        db_integration = AiopgIntegration(self.tracer, "testcomponent")
+        traced_connection = aiopg_integration.get_traced_connection_proxy(
+            AiopgConnectionMock(), db_integration
+        )
+
+        async def acquire():
+            return traced_connection
+
+        pool = AiopgPoolMock()
+        pool._acquire = acquire
+        traced_pool = aiopg_integration.get_traced_pool_proxy(
+            pool, db_integration
+        )
+        # pylint: disable=protected-access
+        connection = async_call(traced_pool._acquire())
+        self.assertIs(connection, traced_connection)
+
+    def test_connection_proxy_compares_as_wrapped(self):
+        db_integration = AiopgIntegration(self.tracer, "testcomponent")
+        connection = AiopgConnectionMock()
+        traced_connection = aiopg_integration.get_traced_connection_proxy(
+            connection, db_integration
+        )
+        self.assertEqual(traced_connection, connection)
+        self.assertIn(traced_connection, {connection})
+
+    def test_proxy_is_instance_of_wrapped_type(self):
+        db_integration = AiopgIntegration(self.tracer, "testcomponent")
+        connection = mock.Mock(spec=aiopg.Connection)
+        traced_connection = aiopg_integration.get_traced_connection_proxy(
+            connection, db_integration
+        )
+        self.assertIsInstance(traced_connection, aiopg.Connection)
+        self.assertIsInstance(
+            traced_connection, aiopg_integration.AsyncProxyObject
+        )
+        self.assertEqual(repr(traced_connection), repr(connection))
+
+        cursor = aiopg_integration.get_traced_cursor_proxy(
+            MockCursor(), db_integration
+        )
+        self.assertIsInstance(cursor, MockCursor)
+
+    def test_proxy_is_weakly_referenceable(self):
+        db_integration = AiopgIntegration(self.tracer, "testcomponent")
+        traced_connection = aiopg_integration.get_traced_connection_proxy(
+            AiopgConnectionMock(), db_integration
+        )
+        cursor = aiopg_integration.get_traced_cursor_proxy(
+            MockCursor(), db_integration
+        )
+        cursors = weakref.WeakSet()
+        cursors.add(cursor)
+        self.assertIn(cursor, cursors)
+        self.assertIs(weakref.ref(traced_connection)(), traced_connection)
+
     def test_unwrap_create_pool(self):
         async def check_connection(pool):
             async with pool.acquire() as connection:
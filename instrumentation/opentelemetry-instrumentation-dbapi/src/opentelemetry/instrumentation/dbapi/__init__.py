@@ -33,17 +33,33 @@ Usage
     # Ex: pyodbc
     trace_integration(pyodbc, "Connection", "odbc")
 
+When ``capture_parameters`` is enabled, the ``db.statement.parameters``
+attribute is truncated to 1024 characters. The limit can be changed with the
+``OTEL_PYTHON_DBAPI_PARAMETERS_MAX_LENGTH`` environment variable.
+
+Query spans are not made the current span while the query runs. Pass
+``propagate_context=True`` to ``trace_integration``, or to ``instrument`` of
+the instrumentations built on this one, to make them current, e.g. for
+database drivers that are themselves instrumented.
+
 API
 ---
 """
 
 import functools
 import logging
+import operator
+import re
+import types
 import typing
+from os import environ
 
 import wrapt
 
 from opentelemetry import trace as trace_api
+from opentelemetry.instrumentation.dbapi.environment_variables import (
+    OTEL_PYTHON_DBAPI_PARAMETERS_MAX_LENGTH,
+)
 from opentelemetry.instrumentation.dbapi.version import __version__
 from opentelemetry.instrumentation.utils import unwrap
 from opentelemetry.semconv.trace import SpanAttributes
@@ -52,6 +68,51 @@ from opentelemetry.trace.status import Status, StatusCode
 
 logger = logging.getLogger(__name__)
 
+_OPERATION_NAME_RE = re.compile(r"\s*(\S+)")
+
+_DEFAULT_MAX_PARAMETERS_LENGTH = 1024
+
+
+def _get_max_parameters_length():
+    value = environ.get(OTEL_PYTHON_DBAPI_PARAMETERS_MAX_LENGTH)
+    if value is None:
+        return _DEFAULT_MAX_PARAMETERS_LENGTH
+    try:
+        max_length = int(value)
+    except ValueError:
+        max_length = None
+    if max_length is None or max_length < 1:
+        logger.warning(
+            "Invalid value %r for %s, using %s",
+            value,
+            OTEL_PYTHON_DBAPI_PARAMETERS_MAX_LENGTH,
+            _DEFAULT_MAX_PARAMETERS_LENGTH,
+        )
+        return _DEFAULT_MAX_PARAMETERS_LENGTH
+    return max_length
+
+
+_MAX_PARAMETERS_LENGTH = _get_max_parameters_length()
+
+
+# Statements larger than this are decoded on every call instead of cached,
+# so that large one-off statements, e.g. bulk inserts with inlined values,
+# are not kept alive by the cache.
+_MAX_CACHED_STATEMENT_SIZE = 4096
+
+
+# Applications tend to run the same statements over and over, so the decoded
+# form of recent bytes statements is kept around.
+@functools.lru_cache(maxsize=256)
+def _decode_cached_statement(statement):
+    return statement.decode("utf8", "replace")
+
+
+def _decode_statement(statement):
+    if len(statement) > _MAX_CACHED_STATEMENT_SIZE:
+        return statement.decode("utf8", "replace")
+    return _decode_cached_statement(statement)
+
 
 def trace_integration(
     connect_module: typing.Callable[..., typing.Any],
@@ -61,6 +122,7 @@ def trace_integration(
     tracer_provider: typing.Optional[TracerProvider] = None,
     capture_parameters: bool = False,
     db_api_integration_factory=None,
+    propagate_context: bool = False,
 ):
     """Integrate with DB API library.
     https://www.python.org/dev/peps/pep-0249/
@@ -75,6 +137,8 @@ def trace_integration(
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
         capture_parameters: Configure if db.statement.parameters should be captured.
+        propagate_context: Configure if query spans should be made the current
+            span while the query runs.
     """
     wrap_connect(
         __name__,
@@ -86,6 +150,7 @@ def trace_integration(
         tracer_provider=tracer_provider,
         capture_parameters=capture_parameters,
         db_api_integration_factory=db_api_integration_factory,
+        propagate_context=propagate_context,
     )
 
 
@@ -99,6 +164,7 @@ def wrap_connect(
     tracer_provider: typing.Optional[TracerProvider] = None,
     capture_parameters: bool = False,
     db_api_integration_factory=None,
+    propagate_context: bool = False,
 ):
     """Integrate with DB API library.
     https://www.python.org/dev/peps/pep-0249/
@@ -113,6 +179,8 @@ def wrap_connect(
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
         capture_parameters: Configure if db.statement.parameters should be captured.
+        propagate_context: Configure if query spans should be made the current
+            span while the query runs.
 
     """
     db_api_integration_factory = (
@@ -133,14 +201,27 @@ def wrap_connect(
             version=version,
             tracer_provider=tracer_provider,
             capture_parameters=capture_parameters,
+            propagate_context=propagate_context,
         )
         return db_integration.wrapped_connection(wrapped, args, kwargs)
 
     try:
-        wrapt.wrap_function_wrapper(
-            connect_module, connect_method_name, wrap_connect_
-        )
-    except Exception as ex:  # pylint: disable=broad-except
+        if isinstance(connect_module, types.ModuleType):
+            # The module is already imported, so wrap the attribute directly
+            # instead of resolving it again through wrapt.
+            setattr(
+                connect_module,
+                connect_method_name,
+                wrapt.FunctionWrapper(
+                    getattr(connect_module, connect_method_name),
+                    wrap_connect_,
+                ),
+            )
+        else:
+            wrapt.wrap_function_wrapper(
+                connect_module, connect_method_name, wrap_connect_
+            )
+    except (AttributeError, ImportError) as ex:
         logger.warning("Failed to integrate with DB API. %s", str(ex))
 
 
@@ -165,6 +246,7 @@ def instrument_connection(
     version: str = "",
     tracer_provider: typing.Optional[TracerProvider] = None,
     capture_parameters=False,
+    propagate_context=False,
 ):
     """Enable instrumentation in a database connection.
 
@@ -177,6 +259,8 @@ def instrument_connection(
         tracer_provider: The :class:`opentelemetry.trace.TracerProvider` to
             use. If omitted the current configured one is used.
         capture_parameters: Configure if db.statement.parameters should be captured.
+        propagate_context: Configure if query spans should be made the current
+            span while the query runs.
     Returns:
         An instrumented connection.
     """
@@ -187,6 +271,7 @@ def instrument_connection(
         version=version,
         tracer_provider=tracer_provider,
         capture_parameters=capture_parameters,
+        propagate_context=propagate_context,
     )
     db_integration.get_connection_attributes(connection)
     return get_traced_connection_proxy(connection, db_integration)
@@ -201,7 +286,7 @@ def uninstrument_connection(connection):
     Returns:
         An uninstrumented connection.
     """
-    if isinstance(connection, wrapt.ObjectProxy):
+    if isinstance(connection, TracedConnectionProxy):
         return connection.__wrapped__
 
     logger.warning("Connection is not instrumented")
@@ -209,6 +294,10 @@ def uninstrument_connection(connection):
 
 
 class DatabaseApiIntegration:
+    # CursorTracer subclass shared by the cursors of this integration,
+    # defaults to CursorTracer
+    cursor_tracer_cls = None
+
     def __init__(
         self,
         name: str,
@@ -217,6 +306,7 @@ class DatabaseApiIntegration:
         version: str = "",
         tracer_provider: typing.Optional[TracerProvider] = None,
         capture_parameters: bool = False,
+        propagate_context: bool = False,
     ):
         self.connection_attributes = connection_attributes
         if self.connection_attributes is None:
@@ -226,22 +316,48 @@ class DatabaseApiIntegration:
                 "host": "host",
                 "user": "user",
             }
+        # Allow attributes nested in connection object
+        self._connection_attribute_getters = {
+            key: operator.attrgetter(value)
+            for key, value in self.connection_attributes.items()
+        }
         self._name = name
         self._version = version
         self._tracer_provider = tracer_provider
+        self._tracer = None
+        self._noop = False
+        self._cursor_tracer = None
         self.capture_parameters = capture_parameters
+        self.propagate_context = propagate_context
         self.database_system = database_system
         self.connection_props = {}
         self.span_attributes = {}
         self.name = ""
         self.database = ""
+        self._static_span_attributes = self._get_static_span_attributes()
 
     def get_tracer(self):
-        return get_tracer(
-            self._name,
-            instrumenting_library_version=self._version,
-            tracer_provider=self._tracer_provider,
-        )
+        if self._tracer is None:
+            self._tracer = get_tracer(
+                self._name,
+                instrumenting_library_version=self._version,
+                tracer_provider=self._tracer_provider,
+            )
+            # pylint: disable=protected-access
+            self._noop = isinstance(self._tracer, trace_api._DefaultTracer)
+        return self._tracer
+
+    def is_noop(self):
+        """Whether the tracer of this integration is a no-op one, so that
+        queries need not be traced at all."""
+        self.get_tracer()
+        return self._noop
+
+    def get_cursor_tracer(self):
+        if self._cursor_tracer is None:
+            cursor_tracer_cls = self.cursor_tracer_cls or CursorTracer
+            self._cursor_tracer = cursor_tracer_cls(self)
+        return self._cursor_tracer
 
     def wrapped_connection(
         self,
@@ -256,22 +372,18 @@ class DatabaseApiIntegration:
 
     def get_connection_attributes(self, connection):
         # Populate span fields using connection
-        for key, value in self.connection_attributes.items():
-            # Allow attributes nested in connection object
-            attribute = functools.reduce(
-                lambda attribute, attribute_value: getattr(
-                    attribute, attribute_value, None
-                ),
-                value.split("."),
-                connection,
-            )
+        for key, getter in self._connection_attribute_getters.items():
+            try:
+                attribute = getter(connection)
+            except AttributeError:
+                continue
             if attribute:
                 self.connection_props[key] = attribute
         self.name = self.database_system
         self.database = self.connection_props.get("database", "")
         if self.database:
             # PyMySQL encodes names with utf-8
-            if hasattr(self.database, "decode"):
+            if isinstance(self.database, (bytes, bytearray)):
                 self.database = self.database.decode(errors="ignore")
             self.name += "." + self.database
         user = self.connection_props.get("user")
@@ -279,37 +391,98 @@ class DatabaseApiIntegration:
         if user and isinstance(user, bytes):
             user = user.decode()
         if user is not None:
-            self.span_attributes[SpanAttributes.DB_USER] = str(user)
+            self.span_attributes[SpanAttributes.DB_USER] = (
+                user if isinstance(user, str) else str(user)
+            )
         host = self.connection_props.get("host")
         if host is not None:
             self.span_attributes[SpanAttributes.NET_PEER_NAME] = host
         port = self.connection_props.get("port")
         if port is not None:
             self.span_attributes[SpanAttributes.NET_PEER_PORT] = port
+        self._static_span_attributes = self._get_static_span_attributes()
 
+    def _get_static_span_attributes(self):
+        # Attributes shared by every span of this integration, set in a
+        # single call per span.
+        attributes = {
+            SpanAttributes.DB_SYSTEM: self.database_system,
+            SpanAttributes.DB_NAME: self.database,
+        }
+        attributes.update(self.span_attributes)
+        return attributes
 
-def get_traced_connection_proxy(
-    connection, db_api_integration, *args, **kwargs
-):
-    # pylint: disable=abstract-method
-    class TracedConnectionProxy(wrapt.ObjectProxy):
-        # pylint: disable=unused-argument
-        def __init__(self, connection, *args, **kwargs):
-            wrapt.ObjectProxy.__init__(self, connection)
-
-        def cursor(self, *args, **kwargs):
-            return get_traced_cursor_proxy(
-                self.__wrapped__.cursor(*args, **kwargs), db_api_integration
-            )
 
-        def __enter__(self):
-            self.__wrapped__.__enter__()
-            return self
+class ProxyObject:
+    """Lightweight proxy forwarding attribute access, comparisons and
+    ``isinstance`` checks to the wrapped object."""
+
+    __slots__ = ("__wrapped__", "__weakref__")
+
+    def __init__(self, wrapped):
+        object.__setattr__(self, "__wrapped__", wrapped)
+
+    def __getattr__(self, name):
+        return getattr(self.__wrapped__, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.__wrapped__, name, value)
 
-        def __exit__(self, *args, **kwargs):
-            self.__wrapped__.__exit__(*args, **kwargs)
+    def __delattr__(self, name):
+        delattr(self.__wrapped__, name)
 
-    return TracedConnectionProxy(connection, *args, **kwargs)
+    # Connection pools keep connections in sets, so a proxy has to compare
+    # and hash like the object it wraps.
+    def __eq__(self, other):
+        return self.__wrapped__ == other
+
+    def __ne__(self, other):
+        return self.__wrapped__ != other
+
+    def __hash__(self):
+        return hash(self.__wrapped__)
+
+    # Forwarding __class__ keeps isinstance checks against the wrapped type
+    # working
+    @property
+    def __class__(self):
+        return self.__wrapped__.__class__
+
+    def __repr__(self):
+        return repr(self.__wrapped__)
+
+    def __str__(self):
+        return str(self.__wrapped__)
+
+    def __bool__(self):
+        return bool(self.__wrapped__)
+
+
+class TracedConnectionProxy(ProxyObject):
+    __slots__ = ("_db_api_integration",)
+
+    def __init__(self, connection, db_api_integration):
+        super().__init__(connection)
+        object.__setattr__(self, "_db_api_integration", db_api_integration)
+
+    def cursor(self, *args, **kwargs):
+        return get_traced_cursor_proxy(
+            self.__wrapped__.cursor(*args, **kwargs), self._db_api_integration
+        )
+
+    def __enter__(self):
+        self.__wrapped__.__enter__()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.__wrapped__.__exit__(*args, **kwargs)
+
+
+# pylint: disable=unused-argument
+def get_traced_connection_proxy(
+    connection, db_api_integration, *args, **kwargs
+):
+    return TracedConnectionProxy(connection, db_api_integration)
 
 
 class CursorTracer:
@@ -322,29 +495,24 @@ class CursorTracer:
         cursor,
         *args: typing.Tuple[typing.Any, typing.Any]
     ):
-        if not span.is_recording():
-            return
         statement = self.get_statement(cursor, args)
-        span.set_attribute(
-            SpanAttributes.DB_SYSTEM, self._db_api_integration.database_system
-        )
-        span.set_attribute(
-            SpanAttributes.DB_NAME, self._db_api_integration.database
-        )
+        # pylint: disable=protected-access
+        span.set_attributes(self._db_api_integration._static_span_attributes)
         span.set_attribute(SpanAttributes.DB_STATEMENT, statement)
 
-        for (
-            attribute_key,
-            attribute_value,
-        ) in self._db_api_integration.span_attributes.items():
-            span.set_attribute(attribute_key, attribute_value)
-
         if self._db_api_integration.capture_parameters and len(args) > 1:
-            span.set_attribute("db.statement.parameters", str(args[1]))
+            parameters = args[1]
+            if not isinstance(parameters, str):
+                parameters = str(parameters)
+            if len(parameters) > _MAX_PARAMETERS_LENGTH:
+                parameters = parameters[:_MAX_PARAMETERS_LENGTH] + "..."
+            span.set_attribute("db.statement.parameters", parameters)
 
     def get_operation_name(self, cursor, args):  # pylint: disable=no-self-use
         if args and isinstance(args[0], str):
-            return args[0].split()[0]
+            match = _OPERATION_NAME_RE.match(args[0])
+            if match:
+                return match.group(1)
         return ""
 
     def get_statement(self, cursor, args):  # pylint: disable=no-self-use
@@ -352,7 +520,7 @@ class CursorTracer:
             return ""
         statement = args[0]
         if isinstance(statement, bytes):
-            return statement.decode("utf8", "replace")
+            return _decode_statement(statement)
         return statement
 
     def traced_execution(
@@ -362,6 +530,10 @@ class CursorTracer:
         *args: typing.Tuple[typing.Any, typing.Any],
         **kwargs: typing.Dict[typing.Any, typing.Any]
     ):
+        if self._db_api_integration.is_noop():
+            return query_method(*args, **kwargs)
+        tracer = self._db_api_integration.get_tracer()
+
         name = self.get_operation_name(cursor, args)
         if not name:
             name = (
@@ -370,43 +542,59 @@ class CursorTracer:
                 else self._db_api_integration.name
             )
 
-        with self._db_api_integration.get_tracer().start_as_current_span(
-            name, kind=SpanKind.CLIENT
-        ) as span:
-            self._populate_span(span, cursor, *args)
+        with self._start_span(tracer, name) as span:
+            if span.is_recording():
+                self._populate_span(span, cursor, *args)
             return query_method(*args, **kwargs)
 
+    def _start_span(self, tracer, name):
+        # Query spans are leaves, so unless asked to they are not made the
+        # current span. The span still records exceptions when used as a
+        # context manager.
+        if self._db_api_integration.propagate_context:
+            return tracer.start_as_current_span(name, kind=SpanKind.CLIENT)
+        return tracer.start_span(name, kind=SpanKind.CLIENT)
 
-def get_traced_cursor_proxy(cursor, db_api_integration, *args, **kwargs):
-    _cursor_tracer = CursorTracer(db_api_integration)
 
-    # pylint: disable=abstract-method
-    class TracedCursorProxy(wrapt.ObjectProxy):
+class TracedCursorProxy(ProxyObject):
+    __slots__ = ("_cursor_tracer",)
 
-        # pylint: disable=unused-argument
-        def __init__(self, cursor, *args, **kwargs):
-            wrapt.ObjectProxy.__init__(self, cursor)
+    def __init__(self, cursor, cursor_tracer):
+        super().__init__(cursor)
+        object.__setattr__(self, "_cursor_tracer", cursor_tracer)
 
-        def execute(self, *args, **kwargs):
-            return _cursor_tracer.traced_execution(
-                self.__wrapped__, self.__wrapped__.execute, *args, **kwargs
-            )
+    def execute(self, *args, **kwargs):
+        cursor = self.__wrapped__
+        return self._cursor_tracer.traced_execution(
+            cursor, cursor.execute, *args, **kwargs
+        )
 
-        def executemany(self, *args, **kwargs):
-            return _cursor_tracer.traced_execution(
-                self.__wrapped__, self.__wrapped__.executemany, *args, **kwargs
-            )
+    def executemany(self, *args, **kwargs):
+        cursor = self.__wrapped__
+        return self._cursor_tracer.traced_execution(
+            cursor, cursor.executemany, *args, **kwargs
+        )
 
-        def callproc(self, *args, **kwargs):
-            return _cursor_tracer.traced_execution(
-                self.__wrapped__, self.__wrapped__.callproc, *args, **kwargs
-            )
+    def callproc(self, *args, **kwargs):
+        cursor = self.__wrapped__
+        return self._cursor_tracer.traced_execution(
+            cursor, cursor.callproc, *args, **kwargs
+        )
 
-        def __enter__(self):
-            self.__wrapped__.__enter__()
-            return self
+    def __iter__(self):
+        return iter(self.__wrapped__)
 
-        def __exit__(self, *args, **kwargs):
-            self.__wrapped__.__exit__(*args, **kwargs)
+    def __next__(self):
+        return next(self.__wrapped__)
 
-    return TracedCursorProxy(cursor, *args, **kwargs)
+    def __enter__(self):
+        self.__wrapped__.__enter__()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.__wrapped__.__exit__(*args, **kwargs)
+
+
+# pylint: disable=unused-argument
+def get_traced_cursor_proxy(cursor, db_api_integration, *args, **kwargs):
+    return TracedCursorProxy(cursor, db_api_integration.get_cursor_tracer())
@@ -14,6 +14,8 @@
 
 
 import logging
+import types
+import weakref
 from unittest import mock
 
 from opentelemetry import trace as trace_api
@@ -71,6 +73,40 @@ class TestDBApiIntegration(TestBase):
         self.assertEqual(span.attributes[SpanAttributes.NET_PEER_PORT], 123)
         self.assertIs(span.status.status_code, trace_api.StatusCode.UNSET)
 
+    def test_nested_connection_attributes(self):
+        connection = mock.Mock(spec=["info"])
+        connection.info = mock.Mock(spec=["dbname", "user"])
+        connection.info.dbname = "testdatabase"
+        connection.info.user = "testuser"
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer,
+            "testcomponent",
+            {
+                "database": "info.dbname",
+                "user": "info.user",
+                "host": "info.host",
+                "port": "port",
+            },
+        )
+        db_integration.get_connection_attributes(connection)
+        self.assertEqual(
+            db_integration.connection_props,
+            {"database": "testdatabase", "user": "testuser"},
+        )
+        self.assertEqual(db_integration.name, "testcomponent.testdatabase")
+
+    def test_encoded_connection_attributes(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        db_integration.get_connection_attributes(
+            MockConnection(b"testdatabase", None, None, b"testuser")
+        )
+        self.assertEqual(db_integration.database, "testdatabase")
+        self.assertEqual(
+            db_integration.span_attributes[SpanAttributes.DB_USER], "testuser"
+        )
+
     def test_span_name(self):
         db_integration = dbapi.DatabaseApiIntegration(
             self.tracer, "testcomponent", {}
@@ -86,11 +122,15 @@ class TestDBApiIntegration(TestBase):
         query"""
         )
         cursor.execute("tab\tseparated query")
+        cursor.execute("\n  SELECT 1")
+        cursor.execute("  ")
         spans_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(spans_list), 3)
+        self.assertEqual(len(spans_list), 5)
         self.assertEqual(spans_list[0].name, "Test")
         self.assertEqual(spans_list[1].name, "multi")
         self.assertEqual(spans_list[2].name, "tab")
+        self.assertEqual(spans_list[3].name, "SELECT")
+        self.assertEqual(spans_list[4].name, "testcomponent")
 
     def test_span_succeeded_with_capture_of_statement_parameters(self):
         connection_props = {
@@ -142,6 +182,37 @@ class TestDBApiIntegration(TestBase):
         self.assertEqual(span.attributes[SpanAttributes.NET_PEER_PORT], 123)
         self.assertIs(span.status.status_code, trace_api.StatusCode.UNSET)
 
+    def test_max_parameters_length_from_env(self):
+        env_name = "OTEL_PYTHON_DBAPI_PARAMETERS_MAX_LENGTH"
+        # pylint: disable=protected-access
+        with mock.patch.dict("os.environ", {env_name: "42"}):
+            self.assertEqual(dbapi._get_max_parameters_length(), 42)
+        with mock.patch.dict("os.environ", clear=True):
+            self.assertEqual(dbapi._get_max_parameters_length(), 1024)
+        for value in ("abc", "0", "-5"):
+            with mock.patch.dict("os.environ", {env_name: value}):
+                with self.assertLogs(level=logging.WARNING):
+                    self.assertEqual(dbapi._get_max_parameters_length(), 1024)
+
+    @mock.patch(
+        "opentelemetry.instrumentation.dbapi._MAX_PARAMETERS_LENGTH", 10
+    )
+    def test_span_statement_parameters_truncated(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent", capture_parameters=True
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        cursor.executemany("Test query", [("param1Value",)] * 100)
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 1)
+        self.assertEqual(
+            spans_list[0].attributes["db.statement.parameters"],
+            "[('param1V...",
+        )
+
     def test_span_not_recording(self):
         connection_props = {
             "database": "testdatabase",
@@ -172,6 +243,46 @@ class TestDBApiIntegration(TestBase):
         self.assertFalse(mock_span.set_attribute.called)
         self.assertFalse(mock_span.set_status.called)
 
+    def test_noop_tracer_skips_span(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer,
+            "testcomponent",
+            # pylint: disable=protected-access
+            tracer_provider=trace_api._DefaultTracerProvider(),
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        with mock.patch.object(
+            db_integration.get_tracer(), "start_span"
+        ) as mock_start_span:
+            cursor.execute("Test query", ("param1Value", False))
+        self.assertFalse(mock_start_span.called)
+
+    def test_span_not_made_current(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        current_spans = []
+        cursor.execute = lambda *args: current_spans.append(
+            trace_api.get_current_span()
+        )
+        cursor.execute("Test query")
+        self.assertIs(current_spans[0], trace_api.INVALID_SPAN)
+
+        db_integration.propagate_context = True
+        cursor.execute("Test query")
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 2)
+        self.assertEqual(
+            current_spans[1].get_span_context(), spans_list[1].context
+        )
+
     def test_span_failed(self):
         db_integration = dbapi.DatabaseApiIntegration(
             self.tracer, "testcomponent"
@@ -192,6 +303,39 @@ class TestDBApiIntegration(TestBase):
         self.assertIs(span.status.status_code, trace_api.StatusCode.ERROR)
         self.assertEqual(span.status.description, "Exception: Test Exception")
 
+    def test_bytes_statement(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        cursor.execute(b"Test query \xff")
+        cursor.execute(b"Test query \xff")
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 2)
+        for span in spans_list:
+            self.assertEqual(
+                span.attributes[SpanAttributes.DB_STATEMENT],
+                "Test query \ufffd",
+            )
+
+    def test_large_bytes_statement_not_cached(self):
+        # pylint: disable=protected-access
+        dbapi._decode_cached_statement.cache_clear()
+        statement = b"INSERT " + b"x" * dbapi._MAX_CACHED_STATEMENT_SIZE
+        self.assertEqual(
+            dbapi._decode_statement(statement), statement.decode()
+        )
+        self.assertEqual(
+            dbapi._decode_cached_statement.cache_info().currsize, 0
+        )
+        dbapi._decode_statement(b"Test query")
+        self.assertEqual(
+            dbapi._decode_cached_statement.cache_info().currsize, 1
+        )
+
     def test_executemany(self):
         db_integration = dbapi.DatabaseApiIntegration(
             self.tracer, "testcomponent"
@@ -225,6 +369,81 @@ class TestDBApiIntegration(TestBase):
             "Test stored procedure",
         )
 
+    def test_tracer_is_cached(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        with mock.patch(
+            "opentelemetry.instrumentation.dbapi.get_tracer"
+        ) as mock_get_tracer:
+            tracer = db_integration.get_tracer()
+            self.assertIs(db_integration.get_tracer(), tracer)
+        self.assertEqual(mock_get_tracer.call_count, 1)
+
+    def test_is_noop(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        self.assertFalse(db_integration.is_noop())
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer,
+            "testcomponent",
+            # pylint: disable=protected-access
+            tracer_provider=trace_api._DefaultTracerProvider(),
+        )
+        self.assertTrue(db_integration.is_noop())
+
+    def test_cursor_tracer_is_shared(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor1 = mock_connection.cursor()
+        cursor2 = mock_connection.cursor()
+        # pylint: disable=protected-access
+        self.assertIs(cursor1._cursor_tracer, cursor2._cursor_tracer)
+
+    def test_proxy_forwards_to_wrapped_objects(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        mock_connection.autocommit = True
+        self.assertTrue(mock_connection.__wrapped__.autocommit)
+
+        cursor = mock_connection.cursor()
+        cursor.arraysize = 10
+        self.assertEqual(cursor.__wrapped__.arraysize, 10)
+        self.assertEqual(list(cursor), [("row1",), ("row2",)])
+
+    def test_proxy_is_instance_of_wrapped_type(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        self.assertIsInstance(mock_connection, MockConnection)
+        self.assertIsInstance(mock_connection, dbapi.TracedConnectionProxy)
+        self.assertIsInstance(cursor, MockCursor)
+        self.assertEqual(repr(cursor), repr(cursor.__wrapped__))
+
+    def test_proxy_is_weakly_referenceable(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            self.tracer, "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor = mock_connection.cursor()
+        self.assertIs(weakref.ref(mock_connection)(), mock_connection)
+        self.assertIs(weakref.ref(cursor)(), cursor)
+
     @mock.patch("opentelemetry.instrumentation.dbapi")
     def test_wrap_connect(self, mock_dbapi):
         dbapi.wrap_connect(self.tracer, mock_dbapi, "connect", "-")
@@ -232,6 +451,33 @@ class TestDBApiIntegration(TestBase):
         self.assertEqual(mock_dbapi.connect.call_count, 1)
         self.assertIsInstance(connection.__wrapped__, mock.Mock)
 
+    def test_wrap_connect_module(self):
+        module = types.ModuleType("mock_dbapi")
+        module.connect = mock_connect
+        dbapi.wrap_connect(self.tracer, module, "connect", "-")
+        connection = module.connect()
+        self.assertIsInstance(connection.__wrapped__, MockConnection)
+
+        dbapi.unwrap_connect(module, "connect")
+        self.assertIs(module.connect, mock_connect)
+
+        with self.assertLogs(level=logging.WARNING):
+            dbapi.wrap_connect(self.tracer, module, "missing", "-")
+
+    def test_propagate_context_forwarded(self):
+        module = types.ModuleType("mock_dbapi")
+        module.connect = mock_connect
+        dbapi.wrap_connect(
+            self.tracer, module, "connect", "-", propagate_context=True
+        )
+        connection = module.connect()
+        # pylint: disable=protected-access
+        self.assertTrue(connection._db_api_integration.propagate_context)
+        connection = dbapi.instrument_connection(
+            self.tracer, mock_connect(), "-", propagate_context=True
+        )
+        self.assertTrue(connection._db_api_integration.propagate_context)
+
     @mock.patch("opentelemetry.instrumentation.dbapi")
     def test_unwrap_connect(self, mock_dbapi):
         dbapi.wrap_connect(self.tracer, mock_dbapi, "connect", "-")
@@ -288,6 +534,9 @@ class MockConnection:
 
 
 class MockCursor:
+    def __iter__(self):
+        return iter([("row1",), ("row2",)])
+
     # pylint: disable=unused-argument, no-self-use
     def execute(self, query, params=None, throw_exception=False):
         if throw_exception:
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+
 import fastapi
 from starlette.routing import Match
 
+from opentelemetry import trace
 from opentelemetry.instrumentation.asgi import OpenTelemetryMiddleware
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.semconv.trace import SpanAttributes
@@ -22,6 +25,8 @@ from opentelemetry.util.http import get_excluded_urls
 
 _excluded_urls = get_excluded_urls("FASTAPI")
 
+_ROUTE_DETAILS_CACHE_SIZE = 1024
+
 
 class FastAPIInstrumentor(BaseInstrumentor):
     """An instrumentor for FastAPI
@@ -35,11 +40,13 @@ class FastAPIInstrumentor(BaseInstrumentor):
     def instrument_app(app: fastapi.FastAPI):
         """Instrument an uninstrumented FastAPI application.
         """
+        if _tracing_disabled():
+            return
         if not getattr(app, "is_instrumented_by_opentelemetry", False):
             app.add_middleware(
                 OpenTelemetryMiddleware,
                 excluded_urls=_excluded_urls,
-                span_details_callback=_get_route_details,
+                span_details_callback=_get_cached_route_details_callback(),
             )
             app.is_instrumented_by_opentelemetry = True
 
@@ -54,11 +61,62 @@ class FastAPIInstrumentor(BaseInstrumentor):
 class _InstrumentedFastAPI(fastapi.FastAPI):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        if _tracing_disabled():
+            return
         self.add_middleware(
             OpenTelemetryMiddleware,
             excluded_urls=_excluded_urls,
-            span_details_callback=_get_route_details,
+            span_details_callback=_get_cached_route_details_callback(),
+        )
+
+
+def _tracing_disabled():
+    """Whether the global tracer provider is an explicit no-op provider.
+
+    The proxy provider returned before an SDK provider is configured does
+    not count, since the SDK provider may still be set later on.
+    """
+    # pylint: disable=protected-access
+    return isinstance(
+        trace.get_tracer_provider(), trace._DefaultTracerProvider
+    )
+
+
+def _get_cached_route_details_callback():
+    """Returns a span details callback caching route lookups per path.
+
+    Each instrumented application gets its own callback, so the cache
+    only holds routes of a single application. The host is part of the
+    cache key as well, since ``Host`` routes match on it. The least
+    recently used entries are dropped once it holds more than
+    ``_ROUTE_DETAILS_CACHE_SIZE`` paths.
+    """
+    cache = OrderedDict()
+
+    def get_route_details(scope):
+        key = (
+            scope["type"],
+            scope.get("method"),
+            scope.get("path"),
+            _get_host(scope),
         )
+        details = cache.get(key)
+        if details is None:
+            details = cache[key] = _get_route_details(scope)
+            if len(cache) > _ROUTE_DETAILS_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return details
+
+    return get_route_details
+
+
+def _get_host(scope):
+    for key, value in scope.get("headers") or ():
+        if key == b"host":
+            return value
+    return None
 
 
 def _get_route_details(scope):
@@ -73,11 +131,12 @@ def _get_route_details(scope):
     route = None
     for starlette_route in app.routes:
         match, _ = starlette_route.matches(scope)
+        # Host routes match on the host only and have no path
         if match == Match.FULL:
-            route = starlette_route.path
+            route = getattr(starlette_route, "path", None)
             break
-        if match == Match.PARTIAL:
-            route = starlette_route.path
+        if match == Match.PARTIAL and route is None:
+            route = getattr(starlette_route, "path", None)
     # method only exists for http, if websocket
     # leave it blank.
     span_name = route or scope.get("method", "")
@@ -17,8 +17,11 @@ from unittest.mock import patch
 
 import fastapi
 from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse
+from starlette.routing import Host, Route, Router
 
 import opentelemetry.instrumentation.fastapi as otel_fastapi
+from opentelemetry import trace
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.util.http import get_excluded_urls
@@ -74,6 +77,36 @@ class TestFastAPIManualInstrumentation(TestBase):
             spans[-1].attributes[SpanAttributes.HTTP_FLAVOR], "1.1"
         )
 
+    def test_fastapi_route_details_cached(self):
+        """Ensure that route lookups are cached per path."""
+        with patch(
+            "opentelemetry.instrumentation.fastapi._get_route_details",
+            wraps=otel_fastapi._get_route_details,
+        ) as mock_get_route_details:
+            self._client.get("/user/123")
+            self._client.get("/user/123")
+            self._client.get("/user/456")
+        self.assertEqual(mock_get_route_details.call_count, 2)
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(
+            spans[-1].attributes[SpanAttributes.HTTP_ROUTE], "/user/{username}"
+        )
+
+    def test_fastapi_route_details_cached_per_host(self):
+        """Ensure that cached route lookups honour host routes."""
+        sub_app = Router(
+            routes=[Route("/foobar", lambda request: PlainTextResponse(""))]
+        )
+        self._app.router.routes.insert(0, Host("api.example.com", sub_app))
+        self._client.get("/foobar")
+        self._client.get("/foobar", headers={"host": "api.example.com"})
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 6)
+        self.assertEqual(
+            spans[2].attributes[SpanAttributes.HTTP_ROUTE], "/foobar"
+        )
+        self.assertNotIn(SpanAttributes.HTTP_ROUTE, spans[5].attributes)
+
     def test_fastapi_excluded_urls(self):
         """Ensure that given fastapi routes are excluded."""
         self._client.get("/exclude/123")
@@ -83,6 +116,21 @@ class TestFastAPIManualInstrumentation(TestBase):
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
+    def test_fastapi_noop_tracer_provider(self):
+        """Ensure that no middleware is added for a no-op tracer provider."""
+        with patch(
+            "opentelemetry.trace.get_tracer_provider",
+            # pylint: disable=protected-access
+            return_value=trace._DefaultTracerProvider(),
+        ):
+            app = self._create_app()
+        self.assertFalse(
+            getattr(app, "is_instrumented_by_opentelemetry", False)
+        )
+        TestClient(app).get("/foobar")
+        spans = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans), 0)
+
     @staticmethod
     def _create_fastapi_app():
         app = fastapi.FastAPI()
@@ -66,21 +66,21 @@ from opentelemetry.util.http import get_excluded_urls
 _logger = getLogger(__name__)
 
 _ENVIRON_STARTTIME_KEY = "opentelemetry-flask.starttime_key"
-_ENVIRON_SPAN_KEY = "opentelemetry-flask.span_key"
-_ENVIRON_ACTIVATION_KEY = "opentelemetry-flask.activation_key"
-_ENVIRON_TOKEN = "opentelemetry-flask.token"
+# Holds the (activation, span, token) of the request span
+_ENVIRON_STATE_KEY = "opentelemetry-flask.state_key"
+
+_HTTP_ROUTE = SpanAttributes.HTTP_ROUTE
 
 
 _excluded_urls = get_excluded_urls("FLASK")
 
 
 def get_default_span_name():
-    span_name = ""
-    try:
-        span_name = flask.request.url_rule.rule
-    except AttributeError:
-        span_name = otel_wsgi.get_default_span_name(flask.request.environ)
-    return span_name
+    request = flask.request
+    rule = request.url_rule
+    if rule is None:
+        return otel_wsgi.get_default_span_name(request.environ)
+    return rule.rule
 
 
 def _rewrapped_app(wsgi_app):
@@ -92,8 +92,14 @@ def _rewrapped_app(wsgi_app):
         wrapped_app_environ[_ENVIRON_STARTTIME_KEY] = _time_ns()
 
         def _start_response(status, response_headers, *args, **kwargs):
-            if not _excluded_urls.url_disabled(flask.request.url):
-                span = flask.request.environ.get(_ENVIRON_SPAN_KEY)
+            state = wrapped_app_environ.get(_ENVIRON_STATE_KEY)
+            # A request with a span is not excluded, so the URL only needs
+            # checking when there is none.
+            if state is not None or not (
+                _excluded_urls
+                and _excluded_urls.url_disabled(flask.request.url)
+            ):
+                span = state[1] if state else None
 
                 propagator = get_global_response_propagator()
                 if propagator:
@@ -120,65 +126,59 @@ def _rewrapped_app(wsgi_app):
     return _wrapped_app
 
 
-def _wrapped_before_request(name_callback):
+def _wrapped_before_request(name_callback, tracer):
     def _before_request():
-        if _excluded_urls.url_disabled(flask.request.url):
+        if _excluded_urls and _excluded_urls.url_disabled(flask.request.url):
             return
 
         flask_request_environ = flask.request.environ
         span_name = name_callback()
-        token = context.attach(
-            extract(flask_request_environ, getter=otel_wsgi.wsgi_getter)
+        request_context = extract(
+            flask_request_environ, getter=otel_wsgi.wsgi_getter
         )
-
-        tracer = trace.get_tracer(__name__, __version__)
+        token = context.attach(request_context)
 
         span = tracer.start_span(
             span_name,
+            context=request_context,
             kind=trace.SpanKind.SERVER,
             start_time=flask_request_environ.get(_ENVIRON_STARTTIME_KEY),
         )
         if span.is_recording():
-            attributes = otel_wsgi.collect_request_attributes(
-                flask_request_environ
+            span.set_attributes(
+                otel_wsgi.collect_request_attributes(flask_request_environ)
             )
-            if flask.request.url_rule:
+            rule = flask.request.url_rule
+            if rule is not None:
                 # For 404 that result from no route found, etc, we
                 # don't have a url_rule.
-                attributes[
-                    SpanAttributes.HTTP_ROUTE
-                ] = flask.request.url_rule.rule
-            for key, value in attributes.items():
-                span.set_attribute(key, value)
+                span.set_attribute(_HTTP_ROUTE, rule.rule)
 
         activation = trace.use_span(span, end_on_exit=True)
         activation.__enter__()  # pylint: disable=E1101
-        flask_request_environ[_ENVIRON_ACTIVATION_KEY] = activation
-        flask_request_environ[_ENVIRON_SPAN_KEY] = span
-        flask_request_environ[_ENVIRON_TOKEN] = token
+        flask_request_environ[_ENVIRON_STATE_KEY] = (activation, span, token)
 
     return _before_request
 
 
 def _teardown_request(exc):
     # pylint: disable=E1101
-    if _excluded_urls.url_disabled(flask.request.url):
-        return
-
-    activation = flask.request.environ.get(_ENVIRON_ACTIVATION_KEY)
-    if not activation:
-        # This request didn't start a span, maybe because it was created in a
-        # way that doesn't run `before_request`, like when it is created with
+    state = flask.request.environ.get(_ENVIRON_STATE_KEY)
+    if not state:
+        # This request didn't start a span, maybe because its URL is
+        # excluded or because it was created in a way that doesn't run
+        # `before_request`, like when it is created with
         # `app.test_request_context`.
         return
 
+    activation, _, token = state
     if exc is None:
         activation.__exit__(None, None, None)
     else:
         activation.__exit__(
             type(exc), exc, getattr(exc, "__traceback__", None)
         )
-    context.detach(flask.request.environ.get(_ENVIRON_TOKEN))
+    context.detach(token)
 
 
 class _InstrumentedFlask(flask.Flask):
@@ -192,7 +192,8 @@ class _InstrumentedFlask(flask.Flask):
         self.wsgi_app = _rewrapped_app(self.wsgi_app)
 
         _before_request = _wrapped_before_request(
-            _InstrumentedFlask.name_callback
+            _InstrumentedFlask.name_callback,
+            trace.get_tracer(__name__, __version__),
         )
         self._before_request = _before_request
         self.before_request(_before_request)
@@ -223,7 +224,9 @@ class FlaskInstrumentor(BaseInstrumentor):
             app._original_wsgi_app = app.wsgi_app
             app.wsgi_app = _rewrapped_app(app.wsgi_app)
 
-            _before_request = _wrapped_before_request(name_callback)
+            _before_request = _wrapped_before_request(
+                name_callback, trace.get_tracer(__name__, __version__)
+            )
             app._before_request = _before_request
             app.before_request(_before_request)
             app.teardown_request(_teardown_request)
@@ -16,16 +16,20 @@ from unittest.mock import Mock, patch
 
 from flask import Flask, request
 
-from opentelemetry import trace
+from opentelemetry import baggage, context, trace
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from opentelemetry.instrumentation.propagators import (
     TraceResponsePropagator,
     get_global_response_propagator,
     set_global_response_propagator,
 )
+from opentelemetry.propagate import get_global_textmap, set_global_textmap
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.test.wsgitestutil import WsgiTestBase
+from opentelemetry.trace.propagation.tracecontext import (
+    TraceContextTextMapPropagator,
+)
 from opentelemetry.util.http import get_excluded_urls
 
 # pylint: disable=import-error
@@ -153,18 +157,83 @@ class TestProgrammatic(InstrumentationTest, TestBase, WsgiTestBase):
 
         set_global_response_propagator(orig)
 
+    def test_distributed_context(self):
+        self.client.get(
+            "/hello/123",
+            headers={
+                "traceparent": "00-{0}-{1}-01".format(
+                    trace.format_trace_id(0x123), trace.format_span_id(0x456),
+                )
+            },
+        )
+        self.client.get("/hello/123")
+
+        span_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(span_list), 2)
+        self.assertEqual(span_list[0].context.trace_id, 0x123)
+        self.assertEqual(span_list[0].parent.span_id, 0x456)
+        self.assertIsNone(span_list[1].parent)
+
+    def test_distributed_context_propagator_fields(self):
+        # Propagators may extract from headers they do not list in fields
+        class _Propagator(TraceContextTextMapPropagator):
+            @property
+            def fields(self):
+                return set()
+
+        orig = get_global_textmap()
+        set_global_textmap(_Propagator())
+        try:
+            self.client.get(
+                "/hello/123",
+                headers={
+                    "traceparent": "00-{0}-{1}-01".format(
+                        trace.format_trace_id(0x123),
+                        trace.format_span_id(0x456),
+                    )
+                },
+            )
+        finally:
+            set_global_textmap(orig)
+
+        span_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(span_list), 1)
+        self.assertEqual(span_list[0].parent.span_id, 0x456)
+
+    def test_request_inside_active_span(self):
+        @self.app.route("/baggage")
+        def _baggage_endpoint():
+            return str(baggage.get_all())
+
+        tracer = self.tracer_provider.get_tracer(__name__)
+        with tracer.start_as_current_span("outer"):
+            token = context.attach(baggage.set_baggage("key", "value"))
+            try:
+                resp = self.client.get("/baggage")
+            finally:
+                context.detach(token)
+
+        self.assertEqual(resp.data, b"{}")
+        span_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(span_list), 2)
+        self.assertEqual(span_list[0].name, "/baggage")
+        self.assertIsNone(span_list[0].parent)
+
     def test_not_recording(self):
         mock_tracer = Mock()
         mock_span = Mock()
         mock_span.is_recording.return_value = False
         mock_tracer.start_span.return_value = mock_span
+        FlaskInstrumentor().uninstrument_app(self.app)
         with patch("opentelemetry.trace.get_tracer") as tracer:
             tracer.return_value = mock_tracer
-            self.client.get("/hello/123")
-            self.assertFalse(mock_span.is_recording())
-            self.assertTrue(mock_span.is_recording.called)
-            self.assertFalse(mock_span.set_attribute.called)
-            self.assertFalse(mock_span.set_status.called)
+            FlaskInstrumentor().instrument_app(self.app)
+        self.client.get("/hello/123")
+        self.assertTrue(mock_tracer.start_span.called)
+        self.assertTrue(mock_span.is_recording.called)
+        self.assertFalse(mock_span.set_attribute.called)
+        self.assertFalse(mock_span.set_attributes.called)
+        self.assertFalse(mock_span.set_status.called)
 
     def test_404(self):
         expected_attrs = expected_attributes(
@@ -61,6 +61,7 @@ class MySQLInstrumentor(BaseInstrumentor):
         https://dev.mysql.com/doc/connector-python/en/
         """
         tracer_provider = kwargs.get("tracer_provider")
+        propagate_context = kwargs.get("propagate_context", False)
 
         dbapi.wrap_connect(
             __name__,
@@ -70,6 +71,7 @@ class MySQLInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
 
     def _uninstrument(self, **kwargs):
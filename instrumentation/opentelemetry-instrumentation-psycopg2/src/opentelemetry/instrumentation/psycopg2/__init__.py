@@ -69,6 +69,7 @@ class Psycopg2Instrumentor(BaseInstrumentor):
            Psycopg: http://initd.org/psycopg/
         """
         tracer_provider = kwargs.get("tracer_provider")
+        propagate_context = kwargs.get("propagate_context", False)
 
         dbapi.wrap_connect(
             __name__,
@@ -78,6 +79,7 @@ class Psycopg2Instrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
             db_api_integration_factory=DatabaseApiIntegration,
         )
 
@@ -103,25 +105,6 @@ class Psycopg2Instrumentor(BaseInstrumentor):
         return connection
 
 
-# TODO(owais): check if core dbapi can do this for all dbapi implementations e.g, pymysql and mysql
-class DatabaseApiIntegration(dbapi.DatabaseApiIntegration):
-    def wrapped_connection(
-        self,
-        connect_method: typing.Callable[..., typing.Any],
-        args: typing.Tuple[typing.Any, typing.Any],
-        kwargs: typing.Dict[typing.Any, typing.Any],
-    ):
-        """Add object proxy to connection object."""
-        base_cursor_factory = kwargs.pop("cursor_factory", None)
-        new_factory_kwargs = {"db_api": self}
-        if base_cursor_factory:
-            new_factory_kwargs["base_factory"] = base_cursor_factory
-        kwargs["cursor_factory"] = _new_cursor_factory(**new_factory_kwargs)
-        connection = connect_method(*args, **kwargs)
-        self.get_connection_attributes(connection)
-        return connection
-
-
 class CursorTracer(dbapi.CursorTracer):
     def get_operation_name(self, cursor, args):
         if not args:
@@ -131,10 +114,7 @@ class CursorTracer(dbapi.CursorTracer):
         if isinstance(statement, Composed):
             statement = statement.as_string(cursor)
 
-        if isinstance(statement, str):
-            return statement.split()[0]
-
-        return ""
+        return super().get_operation_name(cursor, (statement,))
 
     def get_statement(self, cursor, args):
         if not args:
@@ -146,6 +126,27 @@ class CursorTracer(dbapi.CursorTracer):
         return statement
 
 
+# TODO(owais): check if core dbapi can do this for all dbapi implementations e.g, pymysql and mysql
+class DatabaseApiIntegration(dbapi.DatabaseApiIntegration):
+    cursor_tracer_cls = CursorTracer
+
+    def wrapped_connection(
+        self,
+        connect_method: typing.Callable[..., typing.Any],
+        args: typing.Tuple[typing.Any, typing.Any],
+        kwargs: typing.Dict[typing.Any, typing.Any],
+    ):
+        """Add object proxy to connection object."""
+        base_cursor_factory = kwargs.pop("cursor_factory", None)
+        new_factory_kwargs = {"db_api": self}
+        if base_cursor_factory:
+            new_factory_kwargs["base_factory"] = base_cursor_factory
+        kwargs["cursor_factory"] = _new_cursor_factory(**new_factory_kwargs)
+        connection = connect_method(*args, **kwargs)
+        self.get_connection_attributes(connection)
+        return connection
+
+
 def _new_cursor_factory(db_api=None, base_factory=None):
     if not db_api:
         db_api = DatabaseApiIntegration(
@@ -156,7 +157,7 @@ def _new_cursor_factory(db_api=None, base_factory=None):
         )
 
     base_factory = base_factory or pg_cursor
-    _cursor_tracer = CursorTracer(db_api)
+    _cursor_tracer = db_api.get_cursor_tracer()
 
     class TracedCursorFactory(base_factory):
         def execute(self, *args, **kwargs):
@@ -62,6 +62,7 @@ class PyMySQLInstrumentor(BaseInstrumentor):
         https://github.com/PyMySQL/PyMySQL/
         """
         tracer_provider = kwargs.get("tracer_provider")
+        propagate_context = kwargs.get("propagate_context", False)
 
         dbapi.wrap_connect(
             __name__,
@@ -71,6 +72,7 @@ class PyMySQLInstrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
 
     def _uninstrument(self, **kwargs):
@@ -33,10 +33,8 @@ API
 ---
 """
 
-import functools
 import types
 
-from requests.models import Response
 from requests.sessions import Session
 from requests.structures import CaseInsensitiveDict
 
@@ -44,15 +42,40 @@ from opentelemetry import context
 from opentelemetry.instrumentation.instrumentor import BaseInstrumentor
 from opentelemetry.instrumentation.requests.version import __version__
 from opentelemetry.instrumentation.utils import http_status_to_status_code
-from opentelemetry.propagate import inject
+from opentelemetry.propagate import get_global_textmap
 from opentelemetry.semconv.trace import SpanAttributes
-from opentelemetry.trace import SpanKind, get_tracer
+from opentelemetry.trace import SpanKind, get_tracer, set_span_in_context
 from opentelemetry.trace.status import Status
 
 # A key to a context variable to avoid creating duplicate spans when instrumenting
 # both, Session.request and Session.send, since Session.request calls into Session.send
 _SUPPRESS_HTTP_INSTRUMENTATION_KEY = "suppress_http_instrumentation"
 
+_HTTP_METHOD = SpanAttributes.HTTP_METHOD
+_HTTP_URL = SpanAttributes.HTTP_URL
+_HTTP_STATUS_CODE = SpanAttributes.HTTP_STATUS_CODE
+_HTTP_FLAVOR = SpanAttributes.HTTP_FLAVOR
+
+# Methods that are already upper case, as used by the requests helpers
+_KNOWN_METHODS = frozenset(
+    (
+        "GET",
+        "POST",
+        "PUT",
+        "DELETE",
+        "HEAD",
+        "PATCH",
+        "OPTIONS",
+        "TRACE",
+        "CONNECT",
+    )
+)
+
+_DEFAULT_SPAN_NAMES = {method: "HTTP " + method for method in _KNOWN_METHODS}
+
+# HTTP versions as reported by urllib3 responses
+_HTTP_VERSION_MAP = {10: "1.0", 11: "1.1", 20: "2.0"}
+
 
 # pylint: disable=unused-argument
 # pylint: disable=R0915
@@ -68,10 +91,11 @@ def _instrument(tracer_provider=None, span_callback=None, name_callback=None):
     # before v1.0.0, Dec 17, 2012, see
     # https://github.com/psf/requests/commit/4e5c4a6ab7bb0195dececdd19bb8505b872fe120)
 
+    tracer = get_tracer(__name__, __version__, tracer_provider)
+
     wrapped_request = Session.request
     wrapped_send = Session.send
 
-    @functools.wraps(wrapped_request)
     def instrumented_request(self, method, url, *args, **kwargs):
         def get_or_create_headers():
             headers = kwargs.get("headers")
@@ -88,15 +112,12 @@ def _instrument(tracer_provider=None, span_callback=None, name_callback=None):
             method, url, call_wrapped, get_or_create_headers
         )
 
-    @functools.wraps(wrapped_send)
     def instrumented_send(self, request, **kwargs):
         def get_or_create_headers():
-            request.headers = (
-                request.headers
-                if request.headers is not None
-                else CaseInsensitiveDict()
-            )
-            return request.headers
+            headers = request.headers
+            if headers is None:
+                headers = request.headers = CaseInsensitiveDict()
+            return headers
 
         def call_wrapped():
             return wrapped_send(self, request, **kwargs)
@@ -108,74 +129,70 @@ def _instrument(tracer_provider=None, span_callback=None, name_callback=None):
     def _instrumented_requests_call(
         method: str, url: str, call_wrapped, get_or_create_headers
     ):
-        if context.get_value("suppress_instrumentation") or context.get_value(
-            _SUPPRESS_HTTP_INSTRUMENTATION_KEY
+        current_context = context.get_current()
+        if context.get_value(
+            "suppress_instrumentation", current_context
+        ) or context.get_value(
+            _SUPPRESS_HTTP_INSTRUMENTATION_KEY, current_context
         ):
             return call_wrapped()
 
         # See
         # https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/trace/semantic_conventions/http.md#http-client
-        method = method.upper()
+        if method not in _KNOWN_METHODS:
+            method = method.upper()
         span_name = ""
         if name_callback is not None:
             span_name = name_callback(method, url)
         if not span_name or not isinstance(span_name, str):
             span_name = get_default_span_name(method)
 
-        labels = {}
-        labels[SpanAttributes.HTTP_METHOD] = method
-        labels[SpanAttributes.HTTP_URL] = url
-
-        with get_tracer(
-            __name__, __version__, tracer_provider
-        ).start_as_current_span(span_name, kind=SpanKind.CLIENT) as span:
-            exception = None
-            if span.is_recording():
-                span.set_attribute(SpanAttributes.HTTP_METHOD, method)
-                span.set_attribute(SpanAttributes.HTTP_URL, url)
-
-            headers = get_or_create_headers()
-            inject(headers)
+        span = tracer.start_span(
+            span_name,
+            kind=SpanKind.CLIENT,
+            attributes={_HTTP_METHOD: method, _HTTP_URL: url},
+        )
+        with span:
+            # Unsampled spans still propagate their context, but nothing is
+            # recorded on them.
+            recording = span.is_recording()
+
+            # The span is current only while the request is sent, in the
+            # same context that suppresses instrumenting it twice.
+            request_context = set_span_in_context(span)
+            get_global_textmap().inject(
+                get_or_create_headers(), context=request_context
+            )
 
             token = context.attach(
-                context.set_value(_SUPPRESS_HTTP_INSTRUMENTATION_KEY, True)
+                context.set_value(
+                    _SUPPRESS_HTTP_INSTRUMENTATION_KEY, True, request_context
+                )
             )
             try:
-                result = call_wrapped()  # *** PROCEED
-            except Exception as exc:  # pylint: disable=W0703
-                exception = exc
-                result = getattr(exc, "response", None)
-            finally:
-                context.detach(token)
-
-            if isinstance(result, Response):
-                if span.is_recording():
-                    span.set_attribute(
-                        SpanAttributes.HTTP_STATUS_CODE, result.status_code
-                    )
-                    span.set_status(
-                        Status(http_status_to_status_code(result.status_code))
-                    )
-                labels[SpanAttributes.HTTP_STATUS_CODE] = str(
-                    result.status_code
+                try:
+                    result = call_wrapped()  # *** PROCEED
+                finally:
+                    context.detach(token)
+            except Exception as exc:
+                # The exception may carry a response
+                _finalize_span(
+                    span,
+                    recording,
+                    getattr(exc, "response", None),
+                    span_callback,
                 )
-                if result.raw and result.raw.version:
-                    labels[SpanAttributes.HTTP_FLAVOR] = (
-                        str(result.raw.version)[:1]
-                        + "."
-                        + str(result.raw.version)[:-1]
-                    )
-            if span_callback is not None:
-                span_callback(span, result)
-
-            if exception is not None:
-                raise exception.with_traceback(exception.__traceback__)
+                raise
+            _finalize_span(span, recording, result, span_callback)
 
         return result
 
+    # Only __wrapped__ is needed, to restore the original on uninstrument
+    instrumented_request.__wrapped__ = wrapped_request
     instrumented_request.opentelemetry_instrumentation_requests_applied = True
     Session.request = instrumented_request
 
+    instrumented_send.__wrapped__ = wrapped_send
     instrumented_send.opentelemetry_instrumentation_requests_applied = True
     Session.send = instrumented_send
 
@@ -203,9 +220,32 @@ def _uninstrument_from(instr_root, restore_as_bound_func=False):
         setattr(instr_root, instr_func_name, original)
 
 
+def _finalize_span(span, recording, result, span_callback):
+    if recording:
+        _set_response_attributes(span, result)
+    if span_callback is not None:
+        span_callback(span, result)
+
+
+def _set_response_attributes(span, result):
+    status_code = getattr(result, "status_code", None)
+    if status_code is None:
+        return
+    span.set_attribute(_HTTP_STATUS_CODE, status_code)
+    span.set_status(Status(http_status_to_status_code(status_code)))
+    flavor = _HTTP_VERSION_MAP.get(
+        getattr(getattr(result, "raw", None), "version", None)
+    )
+    if flavor is not None:
+        span.set_attribute(_HTTP_FLAVOR, flavor)
+
+
 def get_default_span_name(method):
     """Default implementation for name_callback, returns HTTP {method_name}."""
-    return "HTTP {}".format(method).strip()
+    span_name = _DEFAULT_SPAN_NAMES.get(method)
+    if span_name is None:
+        span_name = "HTTP {}".format(method).strip()
+    return span_name
 
 
 class RequestsInstrumentor(BaseInstrumentor):
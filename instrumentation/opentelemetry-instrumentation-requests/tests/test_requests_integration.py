@@ -83,6 +83,7 @@ class RequestsIntegrationTestBase(abc.ABC):
                 SpanAttributes.HTTP_METHOD: "GET",
                 SpanAttributes.HTTP_URL: self.URL,
                 SpanAttributes.HTTP_STATUS_CODE: 200,
+                SpanAttributes.HTTP_FLAVOR: "1.1",
             },
         )
 
@@ -214,6 +215,38 @@ class RequestsIntegrationTestBase(abc.ABC):
         finally:
             set_global_textmap(previous_propagator)
 
+    def test_http2_flavor(self):
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = mock.Mock(version=20, _original_response=None)
+        response._content = b""  # pylint: disable=protected-access
+        with mock.patch(
+            "requests.adapters.HTTPAdapter.send", return_value=response
+        ):
+            self.perform_request(self.URL)
+
+        span = self.assert_span()
+        self.assertEqual(span.attributes[SpanAttributes.HTTP_FLAVOR], "2.0")
+
+    def test_span_is_current_while_sending(self):
+        current_spans = []
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b""  # pylint: disable=protected-access
+
+        def send(*args, **kwargs):
+            current_spans.append(trace.get_current_span())
+            return response
+
+        with mock.patch("requests.adapters.HTTPAdapter.send", send):
+            self.perform_request(self.URL)
+
+        span = self.assert_span()
+        self.assertEqual(
+            current_spans[0].get_span_context(), span.get_span_context()
+        )
+        self.assertIs(trace.get_current_span(), trace.INVALID_SPAN)
+
     def test_span_callback(self):
         RequestsInstrumentor().uninstrument()
 
@@ -236,6 +269,7 @@ class RequestsIntegrationTestBase(abc.ABC):
                 SpanAttributes.HTTP_METHOD: "GET",
                 SpanAttributes.HTTP_URL: self.URL,
                 SpanAttributes.HTTP_STATUS_CODE: 200,
+                SpanAttributes.HTTP_FLAVOR: "1.1",
                 "http.response.body": "Hello!",
             },
         )
@@ -357,6 +391,14 @@ class TestRequestsIntegration(RequestsIntegrationTestBase, TestBase):
         )
         self.assertEqual(span.status.status_code, StatusCode.ERROR)
 
+    def test_lowercase_method(self):
+        result = requests.request("get", self.URL)
+        self.assertEqual(result.text, "Hello!")
+
+        span = self.assert_span()
+        self.assertEqual(span.name, "HTTP GET")
+        self.assertEqual(span.attributes[SpanAttributes.HTTP_METHOD], "GET")
+
     def test_if_headers_equals_none(self):
         result = requests.get(self.URL, headers=None)
         self.assertEqual(result.text, "Hello!")
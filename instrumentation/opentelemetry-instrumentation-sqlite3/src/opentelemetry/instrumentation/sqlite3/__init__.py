@@ -58,6 +58,7 @@ class SQLite3Instrumentor(BaseInstrumentor):
         https://docs.python.org/3/library/sqlite3.html
         """
         tracer_provider = kwargs.get("tracer_provider")
+        propagate_context = kwargs.get("propagate_context", False)
 
         dbapi.wrap_connect(
             __name__,
@@ -67,6 +68,7 @@ class SQLite3Instrumentor(BaseInstrumentor):
             self._CONNECTION_ATTRIBUTES,
             version=__version__,
             tracer_provider=tracer_provider,
+            propagate_context=propagate_context,
         )
 
     def _uninstrument(self, **kwargs):
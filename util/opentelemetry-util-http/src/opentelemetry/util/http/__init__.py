@@ -14,7 +14,6 @@
 
 from os import environ
 from re import compile as re_compile
-from re import search
 
 
 class ExcludeList:
@@ -22,11 +21,19 @@ class ExcludeList:
 
     def __init__(self, excluded_urls):
         self._excluded_urls = excluded_urls
-        if self._excluded_urls:
-            self._regex = re_compile("|".join(excluded_urls))
+        # All patterns are compiled into a single alternation so checking a
+        # URL is one search of the compiled pattern.
+        self._regex = (
+            re_compile("|".join(excluded_urls)) if excluded_urls else None
+        )
+
+    def __bool__(self) -> bool:
+        """Whether any URL is excluded at all, which lets callers skip
+        building the URL to check."""
+        return self._regex is not None
 
     def url_disabled(self, url: str) -> bool:
-        return bool(self._excluded_urls and search(self._regex, url))
+        return self._regex is not None and self._regex.search(url) is not None
 
 
 _root = r"OTEL_PYTHON_{}"